@@ -270,8 +270,8 @@ class ConversationManager:
             else:
                 logger.info("No session context found, using original message")
             
-            # Start streaming response
-            assistant_content = ""
+            # Start streaming response; chunks are joined once at the end
+            assistant_parts = []
             
             async for event in self.streaming_handler.start_streaming_session(
                 session_id=session_id,
@@ -282,7 +282,7 @@ class ConversationManager:
             ):
                 # Collect assistant content
                 if event.type.value == "content" and event.content:
-                    assistant_content += event.content
+                    assistant_parts.append(event.content)
                 
                 # Yield streaming event
                 yield {
@@ -295,11 +295,12 @@ class ConversationManager:
                 }
             
             # Add assistant response to conversation and memory
-            if assistant_content.strip():
+            assistant_content = "".join(assistant_parts).strip()
+            if assistant_content:
                 assistant_message_id = self.add_message(
                     session_id=session_id,
                     role=MessageRole.ASSISTANT,
-                    content=assistant_content.strip(),
+                    content=assistant_content,
                     metadata={"response_to": user_message_id}
                 )
                 
@@ -310,7 +311,7 @@ class ConversationManager:
                         session_id=session_id,
                         agent_id=conversation.agent_id,
                         role="assistant",
-                        content=assistant_content.strip(),
+                        content=assistant_content,
                         metadata={"response_to": user_message_id}
                     )
                     logger.info(f"Stored assistant response in memory: {memory_id}")
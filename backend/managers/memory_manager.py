@@ -3,17 +3,32 @@ Memory Management System for Google ADK
 Handles conversation memory, context persistence, and retrieval
 """
 
+import copy
 import uuid
 import json
 import sqlite3
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
+from functools import lru_cache
 from threading import Lock
 from pathlib import Path
+from cachetools import TTLCache
 from loguru import logger
 
 
+@lru_cache(maxsize=2048)
+def _query_terms(query: str) -> Tuple[str, Tuple[str, ...]]:
+    """Lowercase and split a search query (cached; scored against every candidate row)"""
+    query_lower = query.lower()
+    return query_lower, tuple(query_lower.split())
+
+
+def _copy_memory_entry(entry: "MemoryEntry") -> "MemoryEntry":
+    """Copy a memory entry so callers never share mutable state with the search cache"""
+    return replace(entry, metadata=copy.deepcopy(entry.metadata), tags=list(entry.tags))
+
+
 @dataclass
 class MemoryEntry:
     """Memory entry data structure"""
@@ -48,6 +63,12 @@ class MemoryManager:
         self.max_entries = max_entries
         self._lock = Lock()
         
+        # Search results keyed by (user_id, query, filters); entries for a user
+        # are dropped whenever that user's memories change
+        self._search_cache = TTLCache(maxsize=1024, ttl=600)
+        self._search_cache_lock = Lock()
+        self._search_cache_generation = 0
+        
         # Initialize database
         self._init_database()
         
@@ -78,6 +99,11 @@ class MemoryManager:
                 conn.execute("CREATE INDEX IF NOT EXISTS idx_agent_id ON memory_entries(agent_id)")
                 conn.execute("CREATE INDEX IF NOT EXISTS idx_created_at ON memory_entries(created_at)")
                 conn.execute("CREATE INDEX IF NOT EXISTS idx_importance ON memory_entries(importance)")
+                # Serves search_memories' per-user ORDER BY ... LIMIT without a full sort
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_user_importance_created "
+                    "ON memory_entries(user_id, importance DESC, created_at DESC)"
+                )
                 
                 conn.commit()
                 
@@ -111,6 +137,10 @@ class MemoryManager:
         try:
             entry_id = str(uuid.uuid4())
             
+            # New entries share one timestamp, formatted once for both columns
+            now = datetime.now()
+            timestamp = now.isoformat()
+            
             # Create memory entry
             entry = MemoryEntry(
                 entry_id=entry_id,
@@ -120,7 +150,9 @@ class MemoryManager:
                 content=content,
                 metadata=metadata or {},
                 tags=tags or [],
-                importance=max(0.0, min(1.0, importance))
+                importance=max(0.0, min(1.0, importance)),
+                created_at=now,
+                updated_at=now
             )
             
             # Store in database
@@ -139,11 +171,13 @@ class MemoryManager:
                         json.dumps(entry.metadata),
                         json.dumps(entry.tags),
                         entry.importance,
-                        entry.created_at.isoformat(),
-                        entry.updated_at.isoformat()
+                        timestamp,
+                        timestamp
                     ))
                     conn.commit()
             
+            self._invalidate_search_cache(user_id)
+            
             # Cleanup old entries if needed
             self._cleanup_old_entries()
             
@@ -286,62 +320,115 @@ class MemoryManager:
         Returns:
             List of matching memory entries with relevance scores
         """
+        cache_key = (user_id, query, limit, min_relevance, tuple(tags) if tags else None, session_id, agent_id)
+        cached, generation = self._get_cached_search(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            # Build SQL query
-            sql = "SELECT * FROM memory_entries WHERE user_id = ?"
-            params = [user_id]
-            
-            # Add filters
-            if session_id:
-                sql += " AND session_id = ?"
-                params.append(session_id)
-            
-            if agent_id:
-                sql += " AND agent_id = ?"
-                params.append(agent_id)
-            
-            # Simple text search (case-insensitive)
-            if query:
-                sql += " AND LOWER(content) LIKE ?"
-                params.append(f"%{query.lower()}%")
-            
-            # Order by importance and creation date
-            sql += " ORDER BY importance DESC, created_at DESC LIMIT ?"
-            params.append(limit)
-            
             with sqlite3.connect(self.db_path) as conn:
                 conn.row_factory = sqlite3.Row
-                cursor = conn.execute(sql, params)
-                rows = cursor.fetchall()
-                
-                memories = []
-                for row in rows:
-                    memory = self._row_to_memory_entry(row)
-                    
-                    # Calculate simple relevance score
-                    if query:
-                        relevance = self._calculate_relevance(memory.content, query)
-                        if relevance >= min_relevance:
-                            memory.relevance_score = relevance
-                            memories.append(memory)
-                    else:
-                        memory.relevance_score = 1.0
-                        memories.append(memory)
-                
-                # Filter by tags if specified
-                if tags:
-                    memories = [m for m in memories if any(tag in m.tags for tag in tags)]
-                
-                # Sort by relevance score
-                memories.sort(key=lambda x: (x.relevance_score or 0, x.importance), reverse=True)
-                
-                logger.info(f"Found {len(memories)} memories for query '{query}'")
-                return memories[:limit]
+                memories = self._search_memories(
+                    conn, user_id, query, limit, min_relevance, tags, session_id, agent_id
+                )
+            
+            self._store_cached_search(cache_key, generation, memories)
+            return memories
                 
         except Exception as e:
             logger.error(f"Failed to search memories: {e}")
             return []
     
+    def _search_memories(self,
+                        conn: sqlite3.Connection,
+                        user_id: str,
+                        query: str,
+                        limit: int,
+                        min_relevance: float,
+                        tags: Optional[List[str]],
+                        session_id: Optional[str],
+                        agent_id: Optional[str]) -> List[MemoryEntry]:
+        """Run one memory search on an open connection"""
+        # Build SQL query
+        sql = "SELECT * FROM memory_entries WHERE user_id = ?"
+        params = [user_id]
+        
+        # Add filters
+        if session_id:
+            sql += " AND session_id = ?"
+            params.append(session_id)
+        
+        if agent_id:
+            sql += " AND agent_id = ?"
+            params.append(agent_id)
+        
+        # Simple text search (case-insensitive)
+        if query:
+            sql += " AND LOWER(content) LIKE ?"
+            params.append(f"%{query.lower()}%")
+        
+        # Order by importance and creation date
+        sql += " ORDER BY importance DESC, created_at DESC LIMIT ?"
+        params.append(limit)
+        
+        cursor = conn.execute(sql, params)
+        rows = cursor.fetchall()
+        
+        memories = []
+        for row in rows:
+            memory = self._row_to_memory_entry(row)
+            
+            # Calculate simple relevance score
+            if query:
+                relevance = self._calculate_relevance(memory.content, query)
+                if relevance >= min_relevance:
+                    memory.relevance_score = relevance
+                    memories.append(memory)
+            else:
+                memory.relevance_score = 1.0
+                memories.append(memory)
+        
+        # Filter by tags if specified
+        if tags:
+            tag_filter = frozenset(tags)
+            memories = [m for m in memories if not tag_filter.isdisjoint(m.tags)]
+        
+        # Sort by relevance score
+        memories.sort(key=lambda x: (x.relevance_score or 0, x.importance), reverse=True)
+        
+        logger.info(f"Found {len(memories)} memories for query '{query}'")
+        return memories[:limit]
+    
+    def _get_cached_search(self, cache_key: tuple) -> Tuple[Optional[List[MemoryEntry]], int]:
+        """Return copies of cached search results (or None) and the current cache generation"""
+        with self._search_cache_lock:
+            cached = self._search_cache.get(cache_key)
+            generation = self._search_cache_generation
+        if cached is None:
+            return None, generation
+        return [_copy_memory_entry(memory) for memory in cached], generation
+    
+    def _store_cached_search(self, cache_key: tuple, generation: int, memories: List[MemoryEntry]):
+        """Cache a snapshot of search results unless a write landed since the search started"""
+        snapshot = tuple(_copy_memory_entry(memory) for memory in memories)
+        with self._search_cache_lock:
+            if generation == self._search_cache_generation:
+                self._search_cache[cache_key] = snapshot
+    
+    def _invalidate_search_cache(self, user_id: Optional[str] = None):
+        """Drop cached search results for one user, or for everyone"""
+        with self._search_cache_lock:
+            self._search_cache_generation += 1
+            if user_id is None:
+                self._search_cache.clear()
+            else:
+                self._search_cache.expire()
+                for key in [key for key in self._search_cache if key[0] == user_id]:
+                    try:
+                        del self._search_cache[key]
+                    except KeyError:
+                        pass  # Expired since the keys were listed
+    
     def update_memory(self,
                      entry_id: str,
                      content: Optional[str] = None,
@@ -385,6 +472,7 @@ class MemoryManager:
                     conn.commit()
                     
                     if cursor.rowcount > 0:
+                        self._invalidate_search_cache()
                         logger.info(f"Updated memory entry {entry_id}")
                         return True
                     return False
@@ -405,6 +493,7 @@ class MemoryManager:
                     conn.commit()
                     
                     if cursor.rowcount > 0:
+                        self._invalidate_search_cache()
                         logger.info(f"Deleted memory entry {entry_id}")
                         return True
                     return False
@@ -513,6 +602,8 @@ class MemoryManager:
                     conn.commit()
                     deleted_count = cursor.rowcount
             
+            if deleted_count:
+                self._invalidate_search_cache()
             logger.info(f"Cleaned up {deleted_count} old memory entries")
             return deleted_count
             
@@ -539,6 +630,7 @@ class MemoryManager:
                         )
                     """, (excess,))
                     conn.commit()
+                    self._invalidate_search_cache()
                     
                     logger.info(f"Cleaned up {excess} old entries to maintain max_entries limit")
                     
@@ -564,15 +656,14 @@ class MemoryManager:
         """Calculate simple relevance score"""
         try:
             content_lower = content.lower()
-            query_lower = query.lower()
-            
-            # Simple scoring based on word matches
-            query_words = query_lower.split()
-            content_words = content_lower.split()
+            query_lower, query_words = _query_terms(query)
             
             if not query_words:
                 return 0.0
             
+            # Simple scoring based on word matches (set lookups per query word)
+            content_words = set(content_lower.split())
+            
             matches = 0
             for word in query_words:
                 if word in content_words:
@@ -0,0 +1,40 @@
+"""
+Tests for the built-in Google ADK tools
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tools.google_adk_tools import custom_calculator
+
+
+def test_calculator_evaluates_long_flat_sum():
+    expression = '+'.join(['1.5'] * 40)
+    assert custom_calculator(expression) == f"Result: {1.5 * 40}"
+
+
+def test_calculator_evaluates_flat_chain_up_to_length_cap():
+    expression = '-'.join(['1'] * 512)
+    assert custom_calculator(expression) == f"Result: {1 - 511}"
+
+
+def test_calculator_rejects_deep_nesting():
+    expression = '1-(' * 40 + '1' + ')' * 40
+    assert custom_calculator(expression).startswith("Error: Expression too deeply nested")
+
+
+def test_calculator_bounds_power_results():
+    assert custom_calculator('((9**999)**999)**999').startswith("Error: Result too large")
+
+
+def test_calculator_binds_name_value_variables():
+    assert custom_calculator('x * 2', ['x=3']) == "Result: 6"
+    assert custom_calculator('x * 2', ['x=3.0']) == "Result: 6.0"
+
+
+def test_calculator_returns_errors_for_bad_argument_types():
+    assert custom_calculator(5).startswith("Error:")
+    assert custom_calculator('x', [1]).startswith("Error:")
+    assert custom_calculator('x', {'x': 1}).startswith("Error:")
@@ -3,13 +3,101 @@ Custom Tools for Google ADK Integration
 Provides fallback implementations and custom tools
 """
 
+# Import modules rather than names: ToolManager.register_from_module registers
+# every public function and class in this module as an agent tool
+import os
 import re
 import ast
-import operator
+import json
+import math
+import socket
+import types
+import functools
+import ipaddress
+import itertools
+import threading
+import collections
+import html.parser
+import urllib.parse
+import concurrent.futures
+import cachetools
 import requests
-from typing import Dict, Any, List
+import requests.adapters
+import urllib3.util.retry
+from typing import Dict, List, Optional
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib json module is used otherwise
+    orjson = None
+
+# Hard cap on json_formatter input; parsing plus indented re-serialization
+# allocates several times the input size
+_MAX_JSON_BYTES = 8 * 1024 * 1024
+
+# Digit runs long enough to overflow a 64-bit integer
+_LONG_DIGIT_RUN_RE = re.compile(r'\d{20}')
+
+# Characters a JSON document can start with (NaN/Infinity are accepted by json.loads)
+_JSON_START_CHARS = frozenset('{["tfnNI-0123456789')
+
+# Shared HTTP session so repeated scrapes reuse pooled keep-alive connections.
+# Only 502/503/504 responses are retried, with a short backoff; Retry-After
+# headers are ignored (urllib3 would otherwise sleep as long as the server asks)
+# and connect/read failures are not retried, so each call stays bounded
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+_HTTP_POOL_MAXSIZE = 20
+_HTTP_ADAPTER = requests.adapters.HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=_HTTP_POOL_MAXSIZE,
+    max_retries=urllib3.util.retry.Retry(
+        total=2, connect=0, read=False, other=0, status=2,
+        backoff_factor=0.3, status_forcelist=[502, 503, 504],
+        respect_retry_after_header=False,
+    ),
+)
+_HTTP_SESSION.mount('http://', _HTTP_ADAPTER)
+_HTTP_SESSION.mount('https://', _HTTP_ADAPTER)
+
+# Successful web_scraper results keyed by (url, max_length), kept for 5 minutes
+_SCRAPE_CACHE = cachetools.TTLCache(maxsize=256, ttl=300)
+_SCRAPE_CACHE_LOCK = threading.Lock()
+
+# Redirects web_scraper follows itself, re-checking each target's addresses
+_MAX_REDIRECTS = 5
+
+# Block size used by file_reader when counting lines past the returned ones
+_READ_BLOCK_SIZE = 64 * 1024
+
+# Word tokens, and non-blank sentence bodies between runs of terminators
+_WORD_RE = re.compile(r'\b\w+\b')
+_SENTENCE_RE = re.compile(r'[^.!?\s][^.!?]*')
+
+# Longest text whose text_analyzer report is memoized
+_MAX_CACHED_TEXT_LENGTH = 64 * 1024
+
+# Sentiment keywords for text_analyzer
+_POSITIVE_WORDS = frozenset({
+    'good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic', 'love', 'like', 'happy', 'joy'
+})
+_NEGATIVE_WORDS = frozenset({
+    'bad', 'terrible', 'awful', 'hate', 'dislike', 'sad', 'angry', 'frustrated', 'disappointed'
+})
+
+# Calculator input bounds: longer or deeper expressions are rejected before
+# evaluation, and powers may not produce results wider than the bit budget
+# (about 3,000 decimal digits, below Python's int-to-str conversion limit)
+_MAX_EXPRESSION_LENGTH = 1024
+_MAX_EXPRESSION_DEPTH = 32
+_MAX_POWER_RESULT_BITS = 10_000
+
+# Characters allowed in calculator expressions, checked before parsing
+_EXPRESSION_CHARS_RE = re.compile(r'[0-9+\-*/%().,=\s\w]+')
+
 
 def google_search(query: str, num_results: int = 5) -> str:
     """
@@ -26,100 +114,168 @@ def google_search(query: str, num_results: int = 5) -> str:
         # This is a mock implementation - in production you'd use actual search API
         logger.info(f"Performing Google search for: {query}")
         
-        # Mock search results
-        results = [
-            {
-                "title": f"Search Result {i+1} for '{query}'",
-                "snippet": f"This is a mock search result snippet for query '{query}'. It contains relevant information about the topic.",
-                "url": f"https://example.com/result-{i+1}",
-                "source": f"example{i+1}.com"
-            }
-            for i in range(min(num_results, 5))
-        ]
-        
-        # Format results
-        formatted_results = []
-        for i, result in enumerate(results, 1):
-            formatted_results.append(
-                f"{i}. **{result['title']}**\n"
-                f"   {result['snippet']}\n"
-                f"   Source: {result['source']}\n"
-                f"   URL: {result['url']}\n"
-            )
+        # Mock search results, formatted directly
+        snippet = f"This is a mock search result snippet for query '{query}'. It contains relevant information about the topic."
         
-        return "\n".join(formatted_results)
+        return "\n".join(
+            f"{i}. **Search Result {i} for '{query}'**\n"
+            f"   {snippet}\n"
+            f"   Source: example{i}.com\n"
+            f"   URL: https://example.com/result-{i}\n"
+            for i in range(1, min(num_results, 5) + 1)
+        )
         
     except Exception as e:
         logger.error(f"Error in google_search: {e}")
         return f"Error performing search: {str(e)}"
 
 
-def custom_calculator(expression: str) -> str:
-    """
-    Safe calculator for mathematical expressions
+# Operators and functions permitted in calculator expressions
+_ALLOWED_OPERATORS = frozenset({
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.Pow,
+    ast.Mod,
+    ast.USub,
+    ast.UAdd,
+})
+
+
+def _check_power_size(base, exponent):
+    """Raise ValueError if base ** exponent would exceed the calculator's bit budget"""
+    # |exponent| * |log2(base)| is the width of the result (or of its reciprocal)
+    if isinstance(base, (int, float)) and isinstance(exponent, (int, float)) and base:
+        if abs(exponent) * abs(math.log2(abs(base))) > _MAX_POWER_RESULT_BITS:
+            raise ValueError(f"Result too large (max {_MAX_POWER_RESULT_BITS:,} bits)")
+
+
+def _bounded_pow(base, exponent, modulus=None):
+    """pow() whose result size is bounded, so chains like ((9**999)**999)**999 are refused"""
+    if modulus is None:
+        _check_power_size(base, exponent)
+    elif isinstance(exponent, int) and isinstance(modulus, int) and max(
+            abs(exponent).bit_length(), abs(modulus).bit_length()) > _MAX_POWER_RESULT_BITS:
+        # Modular results stay small, but the work grows with both operand sizes
+        raise ValueError(f"Operands too large (max {_MAX_POWER_RESULT_BITS:,} bits)")
+    return pow(base, exponent, modulus)
+
+
+def _bounded_round(number, ndigits=None):
+    """round() that refuses precisions whose 10 ** ndigits scale exceeds the bit budget"""
+    if isinstance(ndigits, int):
+        _check_power_size(10, ndigits)
+    return round(number, ndigits)
+
+
+_ALLOWED_FUNCTIONS = {
+    'abs': abs,
+    'round': _bounded_round,
+    'min': min,
+    'max': max,
+    'sum': sum,
+    'pow': _bounded_pow,
+}
+
+# Globals for evaluating compiled calculator code: no builtins are reachable
+_CALCULATOR_GLOBALS = {"__builtins__": {}}
+
+
+def _validate_node(node: ast.AST, names: frozenset = frozenset(), depth: int = 0,
+                   _ops=_ALLOWED_OPERATORS, _fns=_ALLOWED_FUNCTIONS):
+    """Ensure an expression AST only uses whitelisted constructs and known variable names"""
+    if depth > _MAX_EXPRESSION_DEPTH:
+        raise ValueError(f"Expression too deeply nested (max depth {_MAX_EXPRESSION_DEPTH})")
     
-    Args:
-        expression: Mathematical expression to evaluate
-        
-    Returns:
-        str: Calculation result or error message
-    """
+    # Binary operations: a left-associative chain such as "1 + 2 + 3" is walked
+    # along its left operands at the same depth, so only real nesting
+    # (parenthesized right operands, calls, unary chains) counts toward the limit
+    while isinstance(node, ast.BinOp):
+        if type(node.op) not in _ops:
+            raise ValueError(f"Unsupported operation: {type(node.op)}")
+        _validate_node(node.right, names, depth + 1)
+        node = node.left
+    
+    if isinstance(node, ast.Constant):  # Numbers
+        if not isinstance(node.value, (int, float, complex)):
+            raise ValueError(f"Unsupported constant: {node.value!r}")
+    elif isinstance(node, ast.Name):  # Variables
+        if node.id not in names:
+            raise ValueError(f"Unknown variable: {node.id}")
+    elif isinstance(node, ast.UnaryOp):  # Unary operations
+        if type(node.op) not in _ops:
+            raise ValueError(f"Unsupported unary operation: {type(node.op)}")
+        _validate_node(node.operand, names, depth + 1)
+    elif isinstance(node, ast.Call):  # Function calls
+        if not isinstance(node.func, ast.Name):
+            raise ValueError(f"Unsupported function: {ast.unparse(node.func)}")
+        if node.func.id not in _fns:
+            raise ValueError(f"Unsupported function: {node.func.id}")
+        for arg in node.args:
+            _validate_node(arg, names, depth + 1)
+        for keyword in node.keywords:
+            _validate_node(keyword.value, names, depth + 1)
+    else:
+        raise ValueError(f"Unsupported node type: {type(node)}")
+
+
+def _rewrite_powers(tree: ast.AST) -> ast.AST:
+    """Rewrite ``a ** b`` as ``pow(a, b)`` so exponents are bounded at runtime"""
+    # ast.walk is iterative, so long operator chains do not hit the recursion limit
+    for node in ast.walk(tree):
+        for field, value in ast.iter_fields(node):
+            if isinstance(value, ast.BinOp) and isinstance(value.op, ast.Pow):
+                setattr(node, field, _pow_call(value))
+            elif isinstance(value, list):
+                value[:] = [_pow_call(item) if isinstance(item, ast.BinOp) and isinstance(item.op, ast.Pow) else item
+                            for item in value]
+    return tree
+
+
+def _pow_call(node: ast.BinOp) -> ast.Call:
+    """Build a located ``pow(left, right)`` call replacing a Pow node"""
+    func = ast.copy_location(ast.Name(id='pow', ctx=ast.Load()), node)
+    return ast.copy_location(ast.Call(func=func, args=[node.left, node.right], keywords=[]), node)
+
+
+def _compile_expression(expression: str, names: frozenset = frozenset()) -> types.CodeType:
+    """Parse, validate and compile a calculator expression to a code object"""
+    tree = ast.parse(expression, mode='eval')
+    _validate_node(tree.body, names)
+    return compile(_rewrite_powers(tree), '<calculator>', 'eval')
+
+
+# Compiled code objects for repeated expressions skip parsing and validation;
+# variable values are bound at eval time, so one entry serves every input
+_compile_expression_cached = functools.lru_cache(maxsize=1024)(_compile_expression)
+
+
+def _parse_number(expression: str):
+    """Return the value of a plain numeric literal, or None if it is not one"""
     try:
-        # Define allowed operators and functions
-        allowed_operators = {
-            ast.Add: operator.add,
-            ast.Sub: operator.sub,
-            ast.Mult: operator.mul,
-            ast.Div: operator.truediv,
-            ast.Pow: operator.pow,
-            ast.Mod: operator.mod,
-            ast.USub: operator.neg,
-            ast.UAdd: operator.pos,
-        }
-        
-        allowed_functions = {
-            'abs': abs,
-            'round': round,
-            'min': min,
-            'max': max,
-            'sum': sum,
-            'pow': pow,
-        }
-        
-        def safe_eval(node):
-            if isinstance(node, ast.Constant):  # Numbers
-                return node.value
-            elif isinstance(node, ast.BinOp):  # Binary operations
-                left = safe_eval(node.left)
-                right = safe_eval(node.right)
-                op = allowed_operators.get(type(node.op))
-                if op:
-                    return op(left, right)
-                else:
-                    raise ValueError(f"Unsupported operation: {type(node.op)}")
-            elif isinstance(node, ast.UnaryOp):  # Unary operations
-                operand = safe_eval(node.operand)
-                op = allowed_operators.get(type(node.op))
-                if op:
-                    return op(operand)
-                else:
-                    raise ValueError(f"Unsupported unary operation: {type(node.op)}")
-            elif isinstance(node, ast.Call):  # Function calls
-                func_name = node.func.id
-                if func_name in allowed_functions:
-                    args = [safe_eval(arg) for arg in node.args]
-                    return allowed_functions[func_name](*args)
-                else:
-                    raise ValueError(f"Unsupported function: {func_name}")
-            else:
-                raise ValueError(f"Unsupported node type: {type(node)}")
-        
-        # Clean the expression
-        expression = expression.strip()
-        
-        # Parse and evaluate
-        tree = ast.parse(expression, mode='eval')
-        result = safe_eval(tree.body)
+        return int(expression)
+    except ValueError:
+        pass
+    try:
+        value = float(expression)
+    except ValueError:
+        return None
+    # float() also accepts "nan"/"inf", which the evaluator rejects
+    return value if math.isfinite(value) else None
+
+
+def _evaluate_expression(expression: str, variables: tuple = ()) -> str:
+    """Evaluate a stripped calculator expression with (name, type, value) variable entries"""
+    try:
+        # Compile (cached for repeated expressions) and evaluate
+        if variables:
+            code = _compile_expression_cached(expression, frozenset(name for name, _, _ in variables))
+            local_names = {**_ALLOWED_FUNCTIONS, **{name: value for name, _, value in variables}}
+            result = eval(code, _CALCULATOR_GLOBALS, local_names)
+        else:
+            code = _compile_expression_cached(expression)
+            result = eval(code, _CALCULATOR_GLOBALS, _ALLOWED_FUNCTIONS)
         
         logger.info(f"Calculator: {expression} = {result}")
         return f"Result: {result}"
@@ -133,38 +289,101 @@ def custom_calculator(expression: str) -> str:
         return f"Error: Invalid expression - {str(e)}"
 
 
-def text_analyzer(text: str) -> str:
+# Memoized results: repeated expressions skip parsing and evaluation entirely
+_evaluate_expression_cached = functools.lru_cache(maxsize=2048)(_evaluate_expression)
+
+
+def _normalize_variables(variables: Optional[List[str]]) -> tuple:
     """
-    Analyze text for various metrics
+    Parse "name=value" calculator variables into sorted (name, type, value) entries
+    
+    The type is part of each entry because the result cache would otherwise treat
+    3 and 3.0 as the same input and return "6" for "6.0".
+    """
+    if not variables:
+        return ()
+    if not isinstance(variables, list):
+        raise ValueError("Variables must be a list of 'name=value' strings")
+    parsed = {}
+    for item in variables:
+        if not isinstance(item, str) or '=' not in item:
+            raise ValueError(f"Invalid variable {item!r}, expected 'name=value'")
+        name, _, raw_value = item.partition('=')
+        name = name.strip()
+        if not name.isidentifier() or name in _ALLOWED_FUNCTIONS:
+            raise ValueError(f"Invalid variable name: {name!r}")
+        if name in parsed:
+            raise ValueError(f"Duplicate variable: {name}")
+        value = _parse_number(raw_value.strip())
+        if value is None:
+            raise ValueError(f"Variable '{name}' must be a number")
+        parsed[name] = value
+    return tuple(sorted((name, type(value), value) for name, value in parsed.items()))
+
+
+def custom_calculator(expression: str, variables: Optional[List[str]] = None) -> str:
+    """
+    Safe calculator for mathematical expressions
     
     Args:
-        text: Text to analyze
+        expression: Mathematical expression to evaluate, optionally using
+            variable names (e.g. "price * (1 + rate)")
+        variables: Values for the variable names used in the expression, as
+            "name=value" strings (e.g. ["price=19.99", "rate=0.2"])
         
     Returns:
-        str: Analysis results
+        str: Calculation result or error message
     """
+    if not isinstance(expression, str):
+        return "Error: Expression must be a string"
+    
+    # Clean the expression
+    expression = expression.strip()
+    
+    # Reject empty, oversized or obviously invalid input before any parsing work
+    if not expression:
+        return "Error: Empty expression"
+    if len(expression) > _MAX_EXPRESSION_LENGTH:
+        return f"Error: Expression too long (max {_MAX_EXPRESSION_LENGTH} characters)"
+    if not _EXPRESSION_CHARS_RE.fullmatch(expression):
+        return "Error: Expression contains unsupported characters"
+    
+    try:
+        variables = _normalize_variables(variables)
+    except ValueError as e:
+        return f"Error: {str(e)}"
+    
+    # Fast path: bare numbers need no parsing or evaluation
+    number = _parse_number(expression)
+    if number is not None:
+        return f"Result: {number}"
+    
+    return _evaluate_expression_cached(expression, variables)
+
+
+def _analyze_text(text: str) -> str:
+    """Compute and format text_analyzer metrics for non-blank text"""
     try:
-        if not text or not text.strip():
-            return "Error: No text provided for analysis"
+        # \w+ words feed sentiment and frequency analysis, while
+        # the word count keeps whitespace tokens so "don't" and "3.14" count once
+        text_lower = text.lower()
+        words = _WORD_RE.findall(text_lower)
+        word_counts = collections.Counter(words)
         
         # Basic metrics
         word_count = len(text.split())
         char_count = len(text)
-        char_count_no_spaces = len(text.replace(' ', ''))
-        sentence_count = len([s for s in re.split(r'[.!?]+', text) if s.strip()])
-        paragraph_count = len([p for p in text.split('\n\n') if p.strip()])
+        char_count_no_spaces = char_count - text.count(' ')
+        sentence_count = sum(1 for _ in _SENTENCE_RE.finditer(text))
+        paragraph_count = sum(1 for p in text.split('\n\n') if p and not p.isspace())
         
         # Average metrics
         avg_words_per_sentence = word_count / max(sentence_count, 1)
         avg_chars_per_word = char_count_no_spaces / max(word_count, 1)
         
-        # Simple sentiment analysis (basic keyword approach)
-        positive_words = ['good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic', 'love', 'like', 'happy', 'joy']
-        negative_words = ['bad', 'terrible', 'awful', 'hate', 'dislike', 'sad', 'angry', 'frustrated', 'disappointed']
-        
-        text_lower = text.lower()
-        positive_count = sum(1 for word in positive_words if word in text_lower)
-        negative_count = sum(1 for word in negative_words if word in text_lower)
+        # Simple sentiment analysis (basic keyword approach, whole words only)
+        positive_count = sum(word_counts[word] for word in _POSITIVE_WORDS)
+        negative_count = sum(word_counts[word] for word in _NEGATIVE_WORDS)
         
         if positive_count > negative_count:
             sentiment = "Positive"
@@ -177,13 +396,9 @@ def text_analyzer(text: str) -> str:
         reading_time_minutes = word_count / 200
         
         # Most common words (simple approach)
-        words = re.findall(r'\b\w+\b', text.lower())
-        word_freq = {}
-        for word in words:
-            if len(word) > 3:  # Only count words longer than 3 characters
-                word_freq[word] = word_freq.get(word, 0) + 1
-        
-        top_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:5]
+        # Only count words longer than 3 characters
+        word_freq = collections.Counter({word: count for word, count in word_counts.items() if len(word) > 3})
+        top_words = word_freq.most_common(5)
         
         # Format results
         analysis = f"""Text Analysis Results:
@@ -219,6 +434,120 @@ def text_analyzer(text: str) -> str:
         return f"Error analyzing text: {str(e)}"
 
 
+# Memoized reports for repeated texts; long texts are analyzed uncached so
+# the cache never pins large strings in memory
+_analyze_text_cached = functools.lru_cache(maxsize=256)(_analyze_text)
+
+
+def text_analyzer(text: str) -> str:
+    """
+    Analyze text for various metrics
+    
+    Args:
+        text: Text to analyze
+        
+    Returns:
+        str: Analysis results
+    """
+    if not text or not text.strip():
+        return "Error: No text provided for analysis"
+    
+    if len(text) > _MAX_CACHED_TEXT_LENGTH:
+        return _analyze_text(text)
+    return _analyze_text_cached(text)
+
+
+class _HTMLTextExtractor(html.parser.HTMLParser):
+    """Incremental HTML-to-text parser that drops script and style contents"""
+    
+    _SKIPPED_TAGS = frozenset({'script', 'style'})
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self.length = 0
+        self._skip_depth = 0
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in self._SKIPPED_TAGS:
+            self._skip_depth += 1
+        # Tags separate words, as the previous regex stripping did
+        self.parts.append(' ')
+    
+    def handle_endtag(self, tag):
+        if tag in self._SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        self.parts.append(' ')
+    
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+            self.length += len(data)
+
+
+def _strip_html_stream(chunks, max_length: int) -> str:
+    """
+    Extract text from streamed HTML chunks
+    
+    Stops consuming chunks once more than max_length characters of
+    whitespace-collapsed text have been collected.
+    """
+    parser = _HTMLTextExtractor()
+    
+    for chunk in chunks:
+        parser.feed(chunk)
+        
+        if parser.length > max_length:
+            # Compact what we have so repeated checks stay cheap
+            collected = ''.join(parser.parts)
+            content = ' '.join(collected.split())
+            if len(content) > max_length:
+                return content
+            if collected[-1:].isspace():
+                content += ' '  # Keep the word boundary before the next chunk
+            parser.parts = [content]
+            parser.length = len(content)
+    
+    parser.close()
+    return ' '.join(''.join(parser.parts).split())
+
+
+def _url_target_error(url: str) -> Optional[str]:
+    """
+    Check that a URL is http(s) and its host resolves only to public addresses
+    
+    Resolving covers every spelling of a local target (decimal or hex IPs,
+    "localhost.", DNS names pointing at private ranges). The address can still
+    change between this check and the request if DNS is rebound in between.
+    
+    Returns:
+        Optional[str]: Error message, or None if the URL may be fetched
+    """
+    if not url.startswith(('http://', 'https://')):
+        return "Error: Invalid URL format. Must start with http:// or https://"
+    
+    parts = urllib.parse.urlsplit(url)
+    try:
+        hostname, port = parts.hostname, parts.port
+    except ValueError:
+        return "Error: Invalid URL format - bad port"
+    if not hostname:
+        return "Error: Invalid URL format - missing host"
+    
+    try:
+        addresses = socket.getaddrinfo(
+            hostname, port or (443 if parts.scheme == 'https' else 80), type=socket.SOCK_STREAM
+        )
+    except (socket.gaierror, UnicodeError):
+        return f"Error: Failed to fetch URL - could not resolve host '{hostname}'"
+    
+    for *_, sockaddr in addresses:
+        # IPv6 link-local results may carry a "%scope" suffix
+        if not ipaddress.ip_address(sockaddr[0].split('%', 1)[0]).is_global:
+            return "Error: URL points to a local or private address"
+    return None
+
+
 def web_scraper(url: str, max_length: int = 1000) -> str:
     """
     Simple web scraper tool
@@ -235,28 +564,54 @@ def web_scraper(url: str, max_length: int = 1000) -> str:
         if not url.startswith(('http://', 'https://')):
             return "Error: Invalid URL format. Must start with http:// or https://"
         
-        # Make request with timeout
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        # Simple text extraction (in production, use BeautifulSoup)
-        content = response.text
-        
-        # Basic HTML tag removal
-        import re
-        content = re.sub(r'<[^>]+>', ' ', content)
-        content = re.sub(r'\s+', ' ', content).strip()
+        # Serve recent scrapes of the same URL from cache
+        cache_key = (url, max_length)
+        with _SCRAPE_CACHE_LOCK:
+            cached = _SCRAPE_CACHE.get(cache_key)
+        if cached is not None:
+            logger.info(f"Returning cached content for {url}")
+            return cached
+        
+        # Follow redirects by hand so every hop gets the same address check
+        target = url
+        for _ in range(_MAX_REDIRECTS + 1):
+            error = _url_target_error(target)
+            if error:
+                return error
+            
+            # Stream the body so we stop downloading once enough text is extracted
+            response = _HTTP_SESSION.get(target, timeout=10, stream=True, allow_redirects=False)
+            redirect = _HTTP_SESSION.get_redirect_target(response)
+            if not redirect:
+                break
+            response.close()
+            target = urllib.parse.urljoin(target, redirect)
+        else:
+            return f"Error: Failed to fetch URL - more than {_MAX_REDIRECTS} redirects"
+        
+        with response:
+            response.raise_for_status()
+            
+            # Without a declared charset iter_content would yield raw bytes
+            if response.encoding is None:
+                response.encoding = 'utf-8'
+            
+            # Incremental text extraction, skipping script/style contents
+            content = _strip_html_stream(
+                response.iter_content(chunk_size=8192, decode_unicode=True),
+                max_length
+            )
         
         # Truncate if too long
         if len(content) > max_length:
             content = content[:max_length] + "..."
         
         logger.info(f"Scraped {len(content)} characters from {url}")
-        return f"Content from {url}:\n\n{content}"
+        result = f"Content from {url}:\n\n{content}"
+        
+        with _SCRAPE_CACHE_LOCK:
+            _SCRAPE_CACHE[cache_key] = result
+        return result
         
     except requests.exceptions.Timeout:
         return "Error: Request timeout - the website took too long to respond"
@@ -267,6 +622,43 @@ def web_scraper(url: str, max_length: int = 1000) -> str:
         return f"Error scraping website: {str(e)}"
 
 
+def web_scraper_batch(urls: List[str], max_length: int = 1000, max_workers: int = 16) -> str:
+    """
+    Scrape several URLs concurrently
+    
+    Args:
+        urls: URLs to scrape
+        max_length: Maximum length of content to return per URL
+        max_workers: Maximum number of concurrent requests (capped at the
+            shared connection pool size)
+        
+    Returns:
+        str: Scraped content (or error message) for each URL, in input order
+    """
+    if not urls:
+        return "Error: No URLs provided"
+    
+    # Requests release the GIL while waiting on the network, so threads overlap the waits;
+    # more threads than pooled connections would only churn connections
+    workers = max(1, min(max_workers, _HTTP_POOL_MAXSIZE, len(urls)))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(lambda url: web_scraper(url, max_length), urls))
+    
+    logger.info(f"Scraped {len(urls)} URLs concurrently")
+    return "\n\n---\n\n".join(results)
+
+
+def _count_remaining_lines(f) -> int:
+    """Count the lines left in a text file by scanning decoded blocks for newlines"""
+    newlines = 0
+    last_char = ''
+    for block in iter(lambda: f.read(_READ_BLOCK_SIZE), ''):
+        newlines += block.count('\n')
+        last_char = block[-1]
+    # A final line without a trailing newline still counts
+    return newlines + (1 if last_char and last_char != '\n' else 0)
+
+
 def file_reader(file_path: str, max_lines: int = 100) -> str:
     """
     Read and return file contents
@@ -279,8 +671,6 @@ def file_reader(file_path: str, max_lines: int = 100) -> str:
         str: File contents or error message
     """
     try:
-        import os
-        
         # Security check - only allow certain file types
         allowed_extensions = ['.txt', '.md', '.json', '.csv', '.log', '.py', '.js', '.html', '.css']
         file_ext = os.path.splitext(file_path)[1].lower()
@@ -292,18 +682,17 @@ def file_reader(file_path: str, max_lines: int = 100) -> str:
         if not os.path.exists(file_path):
             return f"Error: File '{file_path}' not found"
         
-        # Read file
+        # Read only the lines we return; count the rest without keeping them
         with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+            lines = list(itertools.islice(f, max(max_lines, 0)))
+            total_lines = len(lines) + _count_remaining_lines(f)
         
         # Limit lines
-        if len(lines) > max_lines:
-            content = ''.join(lines[:max_lines])
-            content += f"\n\n... (truncated, showing first {max_lines} lines of {len(lines)} total)"
-        else:
-            content = ''.join(lines)
+        content = ''.join(lines)
+        if total_lines > max_lines:
+            content += f"\n\n... (truncated, showing first {max_lines} lines of {total_lines} total)"
         
-        logger.info(f"Read {len(lines)} lines from {file_path}")
+        logger.info(f"Read {total_lines} lines from {file_path}")
         return f"Contents of {file_path}:\n\n{content}"
         
     except UnicodeDecodeError:
@@ -315,6 +704,66 @@ def file_reader(file_path: str, max_lines: int = 100) -> str:
         return f"Error reading file: {str(e)}"
 
 
+class _LargeJSONInt(int):
+    """Integer beyond orjson's 64-bit range, serialized through a Fragment"""
+
+
+class _JSONConstant(float):
+    """NaN/Infinity literal accepted by the stdlib parser but not by orjson"""
+
+
+def _parse_json_int(text: str) -> int:
+    """parse_int hook tagging integers orjson cannot serialize natively"""
+    value = int(text)
+    if -2**63 <= value < 2**64:
+        return value
+    return _LargeJSONInt(value)
+
+
+def _orjson_default(obj):
+    """Serialize the markers produced by the stdlib fallback parser"""
+    if isinstance(obj, _LargeJSONInt):
+        return orjson.Fragment(str(int(obj)))
+    if isinstance(obj, _JSONConstant):
+        if math.isnan(obj):
+            return orjson.Fragment('NaN')
+        return orjson.Fragment('Infinity' if obj > 0 else '-Infinity')
+    raise TypeError
+
+
+def _parse_and_format_json(json_string: str):
+    """Parse JSON and pretty-print it with a 2-space indent, preferring orjson"""
+    if orjson is None:
+        data = json.loads(json_string)
+        return data, json.dumps(data, indent=2, ensure_ascii=False)
+    
+    # orjson turns integers beyond 64 bits into floats and rejects NaN, so
+    # those inputs are parsed by the stdlib; either way orjson does the
+    # formatting, so output never depends on unrelated parts of the input
+    data = None
+    if not _LONG_DIGIT_RUN_RE.search(json_string):
+        try:
+            data = orjson.loads(json_string)
+        except orjson.JSONDecodeError:
+            pass
+    if data is None:
+        data = json.loads(json_string, parse_int=_parse_json_int, parse_constant=_JSONConstant)
+    
+    try:
+        formatted = orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_SUBCLASS,
+            default=_orjson_default,
+        ).decode('utf-8')
+    except orjson.JSONEncodeError:
+        # Deep nesting or lone surrogates orjson will not encode
+        formatted = json.dumps(data, indent=2, ensure_ascii=False)
+    
+    if isinstance(data, (_LargeJSONInt, _JSONConstant)):
+        data = int(data) if isinstance(data, int) else float(data)
+    return data, formatted
+
+
 def json_formatter(json_string: str) -> str:
     """
     Format and validate JSON
@@ -326,24 +775,24 @@ def json_formatter(json_string: str) -> str:
         str: Formatted JSON or error message
     """
     try:
-        import json
-        
-        # Parse JSON
-        data = json.loads(json_string)
-        
-        # Format with indentation
-        formatted = json.dumps(data, indent=2, ensure_ascii=False)
-        
-        # Add some statistics
-        def count_items(obj, item_type="items"):
-            if isinstance(obj, dict):
-                return len(obj)
-            elif isinstance(obj, list):
-                return len(obj)
-            else:
-                return 1
-        
-        stats = f"JSON Statistics:\n- Type: {type(data).__name__}\n- Items: {count_items(data)}"
+        # Reject oversized payloads before allocating the parse tree
+        if len(json_string) > _MAX_JSON_BYTES:
+            return (f"Error: JSON input too large ({len(json_string):,} characters, "
+                    f"limit is {_MAX_JSON_BYTES:,})")
+        
+        # Cheap rejection of input that cannot be a JSON document
+        stripped = json_string.lstrip()
+        if not stripped:
+            return "Error: No JSON provided"
+        if stripped[0] not in _JSON_START_CHARS:
+            return f"Error: Invalid JSON format - unexpected leading character {stripped[0]!r}"
+        
+        # Parse and format with indentation
+        data, formatted = _parse_and_format_json(json_string)
+        
+        # Add some statistics (containers report their length, scalars count as one)
+        item_count = len(data) if isinstance(data, (dict, list)) else 1
+        stats = f"JSON Statistics:\n- Type: {type(data).__name__}\n- Items: {item_count}"
         
         return f"{stats}\n\nFormatted JSON:\n```json\n{formatted}\n```"
         